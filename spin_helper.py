@@ -7,13 +7,13 @@ import os
 import sys
 import time
 import json
-import queue
+import collections
 import threading
 import subprocess
 import random
 import math
-from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, List, Dict
 from enum import Enum
 
 import tkinter as tk
@@ -21,15 +21,23 @@ from tkinter import ttk, messagebox, filedialog, simpledialog
 
 # Import checks
 PIL_AVAILABLE = False
+NUMPY_AVAILABLE = False
 PYAUTOGUI_AVAILABLE = False
 PYNPUT_AVAILABLE = False
+MSS_AVAILABLE = False
 
 try:
-    from PIL import Image, ImageGrab, ImageChops, ImageStat, ImageTk
+    from PIL import Image, ImageGrab, ImageTk
     PIL_AVAILABLE = True
 except ImportError:
     print("WARNING: PIL (Pillow) not available - image processing disabled")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    print("WARNING: NumPy not available - spin detection disabled")
+
 try:
     import pyautogui as pg
     pg.FAILSAFE = False
@@ -43,10 +51,17 @@ try:
 except ImportError:
     print("INFO: pynput not available - click detection disabled")
 
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    print("INFO: mss not available - using PIL ImageGrab for screen capture")
+
 # --------------- Constants ---------------
 
 APP_VERSION = "1.18.10"
 UI_FLUSH_MS = 60
+LOG_QUEUE_MAX = 1000  # pending log lines kept if the UI falls behind
 SESSIONS_DIR = os.path.join(os.path.expanduser("~"), "spin_helper_sessions")
 
 # Spin detection thresholds
@@ -55,9 +70,24 @@ PIX_DIFF_CHANGED = 10.0
 READY_SLACK = 4.5  # tolerance to treat near-baseline as READY
 SPIN_CHANGE_TIMEOUT = 25.0
 CHANGE_STICK_MS = 180
+# Adaptive change polling: start fast, back off while the ROI is quiet
+CHANGE_POLL_MIN = 0.02
+CHANGE_POLL_MAX = 0.2
+CHANGE_POLL_BACKOFF = 1.25
+# Relative brightness drop vs READY that is decisively NOT_READY (skips diffing)
+SPIN_DARKEN_NOT_READY = 0.35
+# Spinner frames are compared sampling every Nth pixel (mean diff keeps its scale)
+SPIN_DOWNSAMPLE = 4
 # Minimum spin duration heuristic (for logging only). Spins shorter than this
 # will be flagged as "short" but still counted to avoid false negatives.
 MIN_VALID_SPIN_MS = 2500
+# Post-click READY polling starts after this fraction of the recent spin duration (EMA)
+SPIN_EMA_INIT_MS = 3000.0
+SPIN_PREWAIT_FRACTION = 0.6
+# The pre-wait ends this long before MIN_VALID_SPIN_MS, leaving room for one grab
+SPIN_PREWAIT_MARGIN_SEC = 0.15
+# Samples above this (bonus rounds, overlays, infinite waits) never enter the EMA
+SPIN_EMA_MAX_SAMPLE_MS = 15000.0
 MAX_CONSECUTIVE_BLIPS = 3
 
 # Long-spin handling (avoid premature rescues on long wins/anticipation)
@@ -74,6 +104,7 @@ FS_ANIM_RMS_ACTIVE = 5.0  # average RMS threshold to consider area "active"
 
 # Mouse movement pause detection
 MOUSE_PAUSE_THRESHOLD = 80
+MOUSE_PAUSE_THRESHOLD_SQ = MOUSE_PAUSE_THRESHOLD * MOUSE_PAUSE_THRESHOLD
 MOUSE_CHECK_INTERVAL = 0.5
 
 # Click timing
@@ -81,6 +112,9 @@ JITTER_PX = 2
 DELAY_MIN, DELAY_MAX = 0.35, 0.75
 GRACE_PERIOD_SECS = 1.0
 
+# Screen geometry is re-queried at most this often (seconds)
+SCREEN_SIZE_TTL = 5.0
+
 # Defaults
 AC_DEFAULT_WAGGLE_ON = False
 AC_DEFAULT_WAGGLE_SECS = 25
@@ -114,26 +148,90 @@ def now_ts():
 def clamp(x, lo, hi):
     return max(lo, min(hi, x))
 
-def _avg_rgb(img: Image.Image) -> Tuple[float, float, float]:
-    if not PIL_AVAILABLE:
-        return (0.0, 0.0, 0.0)
-    stat = ImageStat.Stat(img)
-    if len(stat.mean) >= 3:
-        return (stat.mean[0], stat.mean[1], stat.mean[2])
-    return (stat.mean[0], stat.mean[0], stat.mean[0])
-
-def _rms(img_a: Image.Image, img_b: Image.Image) -> float:
-    if not PIL_AVAILABLE:
-        return 0.0
-    diff = ImageChops.difference(img_a, img_b)
-    stat = ImageStat.Stat(diff)
-    return stat.mean[0] if stat.mean else 0.0
-
-def _brightness(img: Image.Image) -> float:
-    if not PIL_AVAILABLE:
-        return 0.5
-    stat = ImageStat.Stat(img.convert("L"))
-    return (stat.mean[0] if stat.mean else 0.0) / 255.0
+_screen_size_cache = {"ts": 0.0, "size": None}
+
+def _screen_size() -> Tuple[int, int]:
+    """pg.size(), memoized for SCREEN_SIZE_TTL since monitor geometry does not change per poll."""
+    now = time.time()
+    if _screen_size_cache["size"] is None or now - _screen_size_cache["ts"] > SCREEN_SIZE_TTL:
+        _screen_size_cache["size"] = tuple(pg.size())
+        _screen_size_cache["ts"] = now
+    return _screen_size_cache["size"]
+
+def _move_click(x: int, y: int, jitter: int = 0, duration: float = 0.08) -> None:
+    """Move (optionally jittered) and left-click.
+
+    Passes _pause=False so pyautogui skips its PAUSE sleep after each call.
+    """
+    if jitter:
+        x += random.randint(-jitter, jitter)
+        y += random.randint(-jitter, jitter)
+    pg.moveTo(x, y, duration=duration, _pause=False)
+    pg.click(_pause=False)
+
+_mss_tls = threading.local()
+
+def release_grabber():
+    """Close the calling thread's mss instance, if any.
+
+    Each thread releases its own handle (workers in their finally blocks, the Tk
+    thread on destroy); closing another thread's handle could pull it out from
+    under a grab in progress.
+    """
+    sct = getattr(_mss_tls, "sct", None)
+    if sct is None:
+        return
+    _mss_tls.sct = None
+    try:
+        sct.close()
+    except Exception:
+        pass
+
+def grab_array(bbox: Tuple[int, int, int, int], region: Optional[Dict[str, int]] = None) -> np.ndarray:
+    """Grab screen region (left, top, right, bottom) as an (H, W, 3) uint8 RGB array.
+
+    Uses a per-thread mss instance when available (mss handles are not thread-safe),
+    avoiding ImageGrab's per-call screencapture + PNG round-trip on macOS.
+    `region` is the matching mss dict when the caller already has one (SpinnerROI.region).
+    """
+    if not MSS_AVAILABLE:
+        return np.asarray(ImageGrab.grab(bbox=bbox))
+    sct = getattr(_mss_tls, "sct", None)
+    if sct is None:
+        sct = _mss_tls.sct = mss.mss()
+    left, top, right, bottom = bbox
+    w, h = right - left, bottom - top
+    shot = sct.grab(region or {"left": left, "top": top, "width": w, "height": h})
+    # View straight onto the BGRA buffer; reversing the first three bytes gives RGB
+    # without the copy shot.rgb would make
+    arr = np.frombuffer(shot.raw, np.uint8).reshape(shot.height, shot.width, 4)[..., 2::-1]
+    # Match ImageGrab: logical-size frames on HiDPI displays
+    if (shot.width, shot.height) != (w, h):
+        arr = arr[::max(1, shot.height // h), ::max(1, shot.width // w)][:h, :w]
+    return arr
+
+def _downsample(arr: np.ndarray, factor: int = SPIN_DOWNSAMPLE) -> np.ndarray:
+    """Nearest-neighbour (stride) downsample of an RGB frame; mean diffs keep their scale."""
+    return arr[::factor, ::factor]
+
+def _frame_diff(cur: np.ndarray, base: np.ndarray) -> float:
+    """Mean |dR| between two equally shaped RGB frames.
+
+    Same metric the PIX_DIFF_* thresholds were tuned on: the first band of
+    ImageStat.Stat(ImageChops.difference(a, b)).mean on RGB images.
+    """
+    d = np.subtract(cur[..., 0], base[..., 0], dtype=np.int16)
+    return float(np.abs(d, out=d).mean())
+
+def _luma_mean(arr: np.ndarray) -> float:
+    """Mean 8-bit luma of an RGB frame (integer BT.601 weights 77/150/29, sum 256)."""
+    s = arr.astype(np.uint16)
+    return float(((s[..., 0] * 77 + s[..., 1] * 150 + s[..., 2] * 29) >> 8).mean())
+
+def _parse_money(s: str) -> float:
+    """Parse a user-entered amount such as "£1,250.50"; blank means 0."""
+    s = (s or "").strip().replace("£", "").replace(",", "")
+    return float(s or "0")
 
 # --------------- Data Models ---------------
 
@@ -143,13 +241,20 @@ class SpinnerROI:
     y: int
     w: int
     h: int
+    # Derived once so polling loops never rebuild them (see grab_array)
+    bbox: Tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+    region: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.bbox = (self.x, self.y, self.x + self.w, self.y + self.h)
+        self.region = {"left": self.x, "top": self.y, "width": self.w, "height": self.h}
 
 @dataclass
 class SpinnerCapture:
     roi: Optional[SpinnerROI] = None
-    baseline_ready: Optional[Image.Image] = None
+    baseline_small: Optional[np.ndarray] = None  # uint8 RGB _downsample() of the READY frame
     aux_roi: Optional[SpinnerROI] = None
-    aux_baseline_ready: Optional[Image.Image] = None
+    aux_baseline_small: Optional[np.ndarray] = None  # uint8 RGB _downsample() of the aux ROI
     ready_color: Optional[Tuple[float, float, float]] = None
     ready_brightness: Optional[float] = None
     center_xy: Optional[Tuple[int, int]] = None
@@ -168,6 +273,8 @@ class AutomationState:
     last_mouse_pos: Optional[Tuple[int,int]] = None
     actual_clicks: int = 0
     suppress_mouse_pause_until: float = 0.0
+    # Set together with stop_requested; worker sleeps wait on it so Stop takes effect at once
+    stop_evt: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
     
 @dataclass
 class SessionStateSlots:
@@ -232,8 +339,8 @@ class ClickDetector:
                         inside = (roi.x <= x <= roi.x + roi.w and roi.y <= y <= roi.y + roi.h)
                     else:
                         sx, sy = self.app.state_slots.spinner.center_xy
-                        distance = math.sqrt((x - sx)**2 + (y - sy)**2)
-                        inside = distance <= 50
+                        dx, dy = x - sx, y - sy
+                        inside = dx * dx + dy * dy <= 50 * 50
                     if inside:
                         # Log interval between clicks as an approximation of spin duration
                         now_t = time.time()
@@ -278,19 +385,21 @@ class MouseMonitor:
             try:
                 if (self.state.automation.mode == AutomationMode.RUNNING and 
                     self.state.spinner.center_xy):
-                    current_pos = pg.position()
-                    sx, sy = self.state.spinner.center_xy
-                    distance = math.sqrt((current_pos[0] - sx)**2 + (current_pos[1] - sy)**2)
-                    
                     # Suppress auto-pause during intentional away-from-spin overlay clicks
+                    # (checked first so no pointer query is made while suppressed)
                     if time.time() < getattr(self.state.automation, 'suppress_mouse_pause_until', 0):
                         time.sleep(MOUSE_CHECK_INTERVAL)
                         continue
 
-                    if distance > MOUSE_PAUSE_THRESHOLD and not self.state.automation.paused_by_mouse:
+                    current_pos = pg.position()
+                    sx, sy = self.state.spinner.center_xy
+                    dx, dy = current_pos[0] - sx, current_pos[1] - sy
+                    dist_sq = dx * dx + dy * dy
+
+                    if dist_sq > MOUSE_PAUSE_THRESHOLD_SQ and not self.state.automation.paused_by_mouse:
                         self.state.automation.paused_by_mouse = True
-                        self.log(f"Auto-paused: mouse moved {distance:.0f}px from spinner", bright_blue=True)
-                    elif distance <= MOUSE_PAUSE_THRESHOLD and self.state.automation.paused_by_mouse:
+                        self.log(f"Auto-paused: mouse moved {math.sqrt(dist_sq):.0f}px from spinner", bright_blue=True)
+                    elif dist_sq <= MOUSE_PAUSE_THRESHOLD_SQ and self.state.automation.paused_by_mouse:
                         self.state.automation.paused_by_mouse = False
                         self.log("Auto-resume: mouse returned to spinner area")
                         
@@ -592,6 +701,10 @@ class EmbeddedCalculator:
         self.amount_var = tk.StringVar()
         self.mult_var = tk.StringVar()
         self.bet_var = tk.StringVar()
+        # Parsed bet_var, refreshed on every edit so pollers and worker threads
+        # read a float instead of re-parsing the Tk string
+        self.bet = 0.0
+        self.bet_var.trace_add("write", self._on_bet_changed)
         # Optional direct input for Scenario 1: Total Wager Target
         self.total_target_input_var = tk.StringVar()
         # Optional policy + balance input
@@ -659,27 +772,29 @@ class EmbeddedCalculator:
         ttk.Button(button_frame, text="Apply Target", command=self._apply).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="Reset", command=self._reset).pack(side=tk.LEFT)
     
+    def _on_bet_changed(self, *_):
+        try:
+            self.bet = _parse_money(self.bet_var.get())
+        except ValueError:
+            self.bet = 0.0
+
     def _update_timer(self):
         """Update current wager display"""
         try:
-            bet = float(self.bet_var.get() or "0")
+            bet = self.bet
             spins = getattr(self.app.state_slots.automation, 'total_done', 0)
             current_wager = spins * bet
             self.current_wager_var.set(f"£{current_wager:.2f}")
         except:
             pass
-        self.app.after(1000, self._update_timer)
+        self.app._after(1000, self._update_timer)
     
     def _calculate(self):
         try:
-            def parse_money(s: str) -> float:
-                s = (s or "").strip().replace("£", "").replace(",", "")
-                return float(s or "0")
-
-            amount = parse_money(self.amount_var.get())
+            amount = _parse_money(self.amount_var.get())
             mult_in = float((self.mult_var.get() or "0").strip() or "0")
-            bet = parse_money(self.bet_var.get())
-            total_in = parse_money(self.total_target_input_var.get())
+            bet = _parse_money(self.bet_var.get())
+            total_in = _parse_money(self.total_target_input_var.get())
 
             if amount <= 0:
                 raise ValueError("Amount must be greater than 0")
@@ -800,68 +915,84 @@ class SpinDetector:
         self.on_actual_click = None  # optional callback to increment app-visible counters
         self.on_overlay_click_start = None
         self.on_overlay_click_end = None
+        self.spin_ema_ms = SPIN_EMA_INIT_MS
+        # True when the last READY was already showing as the pre-wait ended, so the
+        # measured duration is only an upper bound on the real spin time
+        self.ready_censored = False
         
     def get_current_state(self) -> SpinState:
-        if not PIL_AVAILABLE or not self.state.spinner.is_valid:
+        if not PIL_AVAILABLE or not NUMPY_AVAILABLE or not self.state.spinner.is_valid:
             return SpinState.UNKNOWN
             
         spinner = self.state.spinner
         roi = spinner.roi
         
         try:
-            current = ImageGrab.grab(bbox=(roi.x, roi.y, roi.x + roi.w, roi.y + roi.h))
-            rms = _rms(current, spinner.baseline_ready)
-            # Compute auxiliary activity if available
-            aux_diff = None
-            if spinner.aux_roi and spinner.aux_baseline_ready is not None:
-                aux = ImageGrab.grab(bbox=(spinner.aux_roi.x, spinner.aux_roi.y,
-                                           spinner.aux_roi.x + spinner.aux_roi.w,
-                                           spinner.aux_roi.y + spinner.aux_roi.h))
-                aux_diff = _rms(aux, spinner.aux_baseline_ready)
+            small = _downsample(grab_array(roi.bbox, roi.region))
+            # Cheap gate first: a strongly darkened button (spin animation/disabled) is NOT_READY.
+            # Measured on the red channel the diff uses: a mean-R drop of PIX_DIFF_CHANGED
+            # implies mean |dR| >= PIX_DIFF_CHANGED, so the full check would agree.
+            r0 = spinner.ready_color[0] if spinner.ready_color else 0.0
+            if r0:
+                drop = r0 - float(small[..., 0].mean())
+                if drop / r0 > SPIN_DARKEN_NOT_READY and drop >= PIX_DIFF_CHANGED:
+                    return SpinState.NOT_READY
+            rms = _frame_diff(small, spinner.baseline_small)
 
             # Relaxed READY check — tolerate small wiggle around baseline
             if rms <= (PIX_DIFF_READY + READY_SLACK):
                 return SpinState.READY
 
-            # If auxiliary region shows strong activity and main is not near ready, treat as NOT_READY
-            if aux_diff is not None and aux_diff >= PIX_DIFF_CHANGED and rms > (PIX_DIFF_READY + READY_SLACK):
-                return SpinState.NOT_READY
-
             if rms >= PIX_DIFF_CHANGED:
                 return SpinState.NOT_READY
+
+            # Main ROI is ambiguous: only now grab and diff the auxiliary region.
+            # If it shows strong activity, treat as NOT_READY.
+            aux_roi = spinner.aux_roi
+            if aux_roi and spinner.aux_baseline_small is not None:
+                aux = _downsample(grab_array(aux_roi.bbox, aux_roi.region))
+                if _frame_diff(aux, spinner.aux_baseline_small) >= PIX_DIFF_CHANGED:
+                    return SpinState.NOT_READY
             return SpinState.UNKNOWN
             
         except Exception:
             return SpinState.UNKNOWN
 
-    def _wait_change_sticky(self, baseline: Image.Image, min_stick_ms: int, timeout: float) -> bool:
-        t0 = time.time()
+    def _wait_change_sticky(self, baseline: np.ndarray, min_stick_ms: int, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        stick_sec = min_stick_ms / 1000.0
         changed_at = None
+        interval = CHANGE_POLL_MIN
+        roi = self.state.spinner.roi
         
-        while time.time() - t0 < timeout:
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                break
             if self.state.automation.stop_requested:
                 return False
                 
-            img = ImageGrab.grab(bbox=(self.state.spinner.roi.x, self.state.spinner.roi.y, 
-                                     self.state.spinner.roi.x + self.state.spinner.roi.w, 
-                                     self.state.spinner.roi.y + self.state.spinner.roi.h))
-            diff = _rms(img, baseline)
+            diff = _frame_diff(_downsample(grab_array(roi.bbox, roi.region)), baseline)
             
             if diff >= PIX_DIFF_CHANGED:
                 if changed_at is None:
-                    changed_at = time.time()
-                elif (time.time() - changed_at) * 1000.0 >= min_stick_ms:
+                    changed_at = now
+                elif now - changed_at >= stick_sec:
                     return True
+                interval = CHANGE_POLL_MIN
             else:
                 changed_at = None
+                interval = min(interval * CHANGE_POLL_BACKOFF, CHANGE_POLL_MAX)
                 
-            time.sleep(0.04)
+            self.state.automation.stop_evt.wait(min(interval, max(0.0, deadline - time.monotonic())))
             
         return False
 
-    def _wait_for_change(self, baseline: Image.Image, become_changed=True, timeout=SPIN_CHANGE_TIMEOUT) -> bool:
-        t0 = time.time()
-        while time.time() - t0 < timeout:
+    def _wait_for_change(self, baseline: np.ndarray, become_changed=True, timeout=SPIN_CHANGE_TIMEOUT) -> bool:
+        deadline = time.monotonic() + timeout
+        interval = CHANGE_POLL_MIN
+        last_state = None
+        while time.monotonic() < deadline:
             if self.state.automation.stop_requested:
                 return False
             state = self.get_current_state()
@@ -869,45 +1000,78 @@ class SpinDetector:
                 return True
             if not become_changed and state == SpinState.READY:
                 return True
-            time.sleep(0.05)
+            if state != last_state:
+                interval = CHANGE_POLL_MIN
+            else:
+                interval = min(interval * CHANGE_POLL_BACKOFF, CHANGE_POLL_MAX)
+            last_state = state
+            self.state.automation.stop_evt.wait(min(interval, max(0.0, deadline - time.monotonic())))
         return False
 
-    def wait_ready_with_grace(self, baseline: Image.Image,
+    def wait_ready_with_grace(self, baseline: np.ndarray,
                                grace_sec: float = LONG_SPIN_GRACE_SEC,
                                max_timeout: float = SPIN_CHANGE_TIMEOUT,
-                               allow_grace_click: bool = False) -> bool:
+                               allow_grace_click: bool = False,
+                               started_at: Optional[float] = None) -> bool:
         """Wait for READY state with a grace window before any rescue.
 
         After grace_sec elapses, optionally perform a single gentle click to
         dismiss potential overlays, then continue waiting up to max_timeout.
+        started_at is the click time (time.time()); the pre-wait then ends
+        before MIN_VALID_SPIN_MS so it can never make a short spin look valid.
         Returns True if READY is observed before timeout.
         """
-        t0 = time.time()
+        t0 = time.monotonic()
+        deadline = t0 + max_timeout
         grace_clicked = False
+        interval = CHANGE_POLL_MIN
         roi = self.state.spinner.roi
-        while time.time() - t0 < max_timeout:
+        self.ready_censored = False
+        # Early grabs are all but certain to see "still spinning"; sleep through them
+        pre_wait = min(max(0.5, self.spin_ema_ms * SPIN_PREWAIT_FRACTION / 1000.0), grace_sec, max_timeout)
+        if started_at is not None:
+            short_until = started_at + MIN_VALID_SPIN_MS / 1000.0 - SPIN_PREWAIT_MARGIN_SEC
+            pre_wait = min(pre_wait, max(0.0, short_until - time.time()))
+        if self.state.automation.stop_evt.wait(pre_wait):
+            return False
+        first_poll = True
+        while time.monotonic() < deadline:
             if self.state.automation.stop_requested:
                 return False
             try:
-                img = ImageGrab.grab(bbox=(roi.x, roi.y, roi.x + roi.w, roi.y + roi.h))
-                diff = _rms(img, baseline)
+                diff = _frame_diff(_downsample(grab_array(roi.bbox, roi.region)), baseline)
             except Exception:
                 diff = PIX_DIFF_CHANGED + 1.0
 
             if diff <= PIX_DIFF_READY:
+                self.ready_censored = first_poll
                 return True
+            first_poll = False
 
-            elapsed = time.time() - t0
-            if elapsed < grace_sec:
-                time.sleep(0.05)
-                continue
+            # No grace clicks here — only passive waiting to avoid accidental spins.
+            # Poll fast once the ROI is settling towards READY, back off while it spins.
+            if diff < PIX_DIFF_CHANGED:
+                interval = CHANGE_POLL_MIN
+            else:
+                interval = min(interval * CHANGE_POLL_BACKOFF, CHANGE_POLL_MAX)
+            self.state.automation.stop_evt.wait(min(interval, max(0.0, deadline - time.monotonic())))
+        return False
 
-            # No grace clicks here — only passive waiting to avoid accidental spins
+    def note_spin_duration(self, elapsed_ms: float, censored: bool = False) -> None:
+        """Fold a completed spin's click-to-READY time into the duration EMA.
 
-            time.sleep(0.03)
-        return False
+        A censored sample (READY already up when the pre-wait ended) is only an
+        upper bound, so it may pull the EMA down but never up. Outliers are
+        dropped and long samples clamped to 2x the EMA.
+        """
+        if elapsed_ms > SPIN_EMA_MAX_SAMPLE_MS:
+            return
+        if censored and elapsed_ms >= self.spin_ema_ms:
+            return
+        sample = min(elapsed_ms, 2.0 * self.spin_ema_ms)
+        self.spin_ema_ms = 0.8 * self.spin_ema_ms + 0.2 * sample
 
-    def _rescue_once_then_wait_ready(self, baseline: Image.Image, wait_after_click: float = SPIN_CHANGE_TIMEOUT) -> bool:
+    def _rescue_once_then_wait_ready(self, baseline: np.ndarray, wait_after_click: float = SPIN_CHANGE_TIMEOUT) -> bool:
         """Perform a single away-from-spin click to advance overlays, then wait READY.
 
         Intentionally avoids clicking the spin button to prevent accidental spins.
@@ -920,7 +1084,7 @@ class SpinDetector:
             self.log(f"Rescue click failed: {e}")
             return False
 
-    def _ensure_ready_before_click(self, baseline: Image.Image) -> bool:
+    def _ensure_ready_before_click(self, baseline: np.ndarray) -> bool:
         if self._wait_for_change(baseline, become_changed=False, timeout=2.5):
             return True
             
@@ -932,10 +1096,10 @@ class SpinDetector:
     def _fs_area_active(self) -> bool:
         """Heuristic: sample FS ROI quickly to estimate if area is animating.
 
-        Requires: PIL available and detection enabled.
+        Requires: PIL and NumPy available and detection enabled.
         """
         try:
-            if not PIL_AVAILABLE:
+            if not PIL_AVAILABLE or not NUMPY_AVAILABLE:
                 return False
             if not getattr(self.state, 'detect_fs', False):
                 return False
@@ -955,11 +1119,11 @@ class SpinDetector:
             # Consider active if any candidate shows sufficient activity
             for roi in rois:
                 samples = []
-                last = ImageGrab.grab(bbox=(roi.x, roi.y, roi.x + roi.w, roi.y + roi.h))
+                last = grab_array(roi.bbox)
                 for _ in range(3):
                     time.sleep(0.06)
-                    cur = ImageGrab.grab(bbox=(roi.x, roi.y, roi.x + roi.w, roi.y + roi.h))
-                    samples.append(_rms(cur, last))
+                    cur = grab_array(roi.bbox)
+                    samples.append(_frame_diff(cur, last))
                     last = cur
                 avg = sum(samples) / max(1, len(samples))
                 if avg >= FS_ANIM_RMS_ACTIVE:
@@ -978,7 +1142,7 @@ class SpinDetector:
                 return None
             sx, sy = self.state.spinner.center_xy
             try:
-                sw, sh = pg.size()
+                sw, sh = _screen_size()
             except Exception:
                 sw, sh = 1920, 1080
             width = max(200, int(sw * 0.35))
@@ -997,7 +1161,7 @@ class SpinDetector:
         try:
             if not PYAUTOGUI_AVAILABLE:
                 return None
-            sw, sh = pg.size()
+            sw, sh = _screen_size()
             width = max(220, int(sw * 0.35))
             height = max(60, int(sh * 0.08))
             x = int(sw * 0.5 - width / 2)
@@ -1029,7 +1193,7 @@ class SpinDetector:
                 ty = min(max(ty, roi.y + 10), roi.y + max(11, roi.h - 10))
             # Keep within screen bounds if possible
             try:
-                sw, sh = pg.size()
+                sw, sh = _screen_size()
                 tx = clamp(tx, 10, sw - 10)
                 ty = clamp(ty, 10, sh - 10)
             except Exception:
@@ -1047,8 +1211,7 @@ class SpinDetector:
                     self.on_overlay_click_start()
             except Exception:
                 pass
-            pg.moveTo(tx, ty, duration=0.08)
-            pg.click()
+            _move_click(tx, ty)
             self.log("Overlay-progress click (away from spin)")
         except Exception:
             pass
@@ -1080,7 +1243,7 @@ class SpinDetector:
                 ty = roi.y + roi.h // 2 + random.randint(-12, 12)
             else:
                 try:
-                    sw, sh = pg.size()
+                    sw, sh = _screen_size()
                 except Exception:
                     sw, sh = 1920, 1080
                 tx = sw // 2 + random.randint(-30, 30)
@@ -1101,8 +1264,7 @@ class SpinDetector:
             except Exception:
                 pass
 
-            pg.moveTo(tx, ty, duration=0.08)
-            pg.click()
+            _move_click(tx, ty)
         except Exception:
             pass
         finally:
@@ -1114,17 +1276,18 @@ class SpinDetector:
 
     def wait_while_fs_active(self, max_seconds: float = 180.0, check_interval: float = 0.5) -> float:
         """Block while FS/animation area is active; returns seconds waited."""
-        t0 = time.time()
+        t0 = time.monotonic()
+        deadline = t0 + max_seconds
         try:
-            while (time.time() - t0) < max_seconds and not self.state.automation.stop_requested:
+            while time.monotonic() < deadline and not self.state.automation.stop_requested:
                 if not self._fs_area_active():
                     break
-                time.sleep(check_interval)
+                self.state.automation.stop_evt.wait(check_interval)
         except Exception:
             pass
-        return time.time() - t0
+        return time.monotonic() - t0
 
-    def ensure_ready_multigrace(self, baseline: Image.Image) -> bool:
+    def ensure_ready_multigrace(self, baseline: np.ndarray) -> bool:
         """Wait for READY with multiple pre-click grace attempts.
 
         Strategy:
@@ -1133,7 +1296,7 @@ class SpinDetector:
            button, each followed by a wait; after each, re-check READY.
         3) If FS detection is available and area is active, bias towards waiting.
         """
-        t0 = time.time()
+        deadline = time.monotonic() + PRE_READY_MAX_TIMEOUT
 
         phase = PreClickPhase.INITIAL_WAIT
         self.log(f"Pre-click phase: {phase.value}", yellow=True)
@@ -1144,7 +1307,7 @@ class SpinDetector:
             return True
 
         clicks = 0
-        while (time.time() - t0) < PRE_READY_MAX_TIMEOUT and clicks < PRE_READY_GRACE_CLICKS:
+        while time.monotonic() < deadline and clicks < PRE_READY_GRACE_CLICKS:
             if self.state.automation.stop_requested:
                 return False
             if self.state.automation.paused_by_mouse or self.state.automation.paused_manually:
@@ -1155,7 +1318,7 @@ class SpinDetector:
             # If FS area appears active, wait briefly before attempting a grace click
             if self._fs_area_active():
                 self.log("Pre-click: spin NOT READY; slots animations active — waiting briefly", orange=True)
-                time.sleep(0.4)
+                self.state.automation.stop_evt.wait(0.4)
                 # quick re-check for ready without clicking
                 if self._wait_for_change(baseline, become_changed=False, timeout=0.5):
                     phase = PreClickPhase.READY
@@ -1165,8 +1328,8 @@ class SpinDetector:
                 # Relaxed READY check: allow small tolerance to break out and click
                 try:
                     roi = self.state.spinner.roi
-                    cur = ImageGrab.grab(bbox=(roi.x, roi.y, roi.x + roi.w, roi.y + roi.h))
-                    if _rms(cur, baseline) <= (PIX_DIFF_READY + 3.0):
+                    cur = grab_array(roi.bbox, roi.region)
+                    if _frame_diff(_downsample(cur), baseline) <= (PIX_DIFF_READY + 3.0):
                         self.log("Pre-click: relaxed READY satisfied — proceeding", yellow=True)
                         return True
                 except Exception:
@@ -1218,13 +1381,7 @@ class SpinDetector:
         x, y = self.state.spinner.center_xy
         try:
             if pg:
-                if with_jitter:
-                    jx = x + random.randint(-JITTER_PX, JITTER_PX)
-                    jy = y + random.randint(-JITTER_PX, JITTER_PX)
-                    pg.moveTo(jx, jy, duration=0.08)
-                else:
-                    pg.moveTo(x, y, duration=0.08)
-                pg.click()
+                _move_click(x, y, jitter=JITTER_PX if with_jitter else 0)
                 return True
             else:
                 time.sleep(0.05)
@@ -1250,15 +1407,20 @@ class SpinHelperApp(tk.Tk):
         self.spin_detector.on_actual_click = self._inc_actual_clicks
         # Hooks to avoid clicking the app window during overlay clicks
         try:
-            self.spin_detector.on_overlay_click_start = lambda: self.after(0, self._overlay_click_begin)
-            self.spin_detector.on_overlay_click_end = lambda: self.after(0, self._overlay_click_end)
+            self.spin_detector.on_overlay_click_start = lambda: self._after(0, self._overlay_click_begin)
+            self.spin_detector.on_overlay_click_end = lambda: self._after(0, self._overlay_click_end)
         except Exception:
             pass
         self.mouse_monitor = MouseMonitor(self.state_slots, self._log)
         self.click_detector = ClickDetector(self)
         
-        self._log_q = queue.Queue()
-        self._stop_evt = threading.Event()
+        self._after_ids = set()  # pending after() callbacks, cancelled in destroy()
+        self._closing = False
+        self._log_q = collections.deque(maxlen=LOG_QUEUE_MAX)
+        self._ui_lock = threading.Lock()
+        self._ui_pending = {}
+        self._flush_scheduled = False
+        self._run_gen = 0  # bumped on every stop; workers exit when theirs is stale
         self._blip_count = 0
         
         # Mode tracking for cross-contamination prevention
@@ -1289,9 +1451,8 @@ class SpinHelperApp(tk.Tk):
         # Build UI and restore
         self._restore_geometry()
         self._build_ui()
-        self.after(UI_FLUSH_MS, self._drain_log)
         # Start Clicker Automatic current wager updater
-        self.after(1000, self._update_clicker_current_wager)
+        self._after(1000, self._update_clicker_current_wager)
         
         self._log(f"Spin Helper v{APP_VERSION} initialized", green=True)
 
@@ -1722,9 +1883,9 @@ class SpinHelperApp(tk.Tk):
         self._log("Spinner capture starting - Move mouse over spin button NOW", green=True)
         self._log("Capturing in 3...", green=True)
         
-        self.after(1000, lambda: self._log("Capturing in 2...", green=True))
-        self.after(2000, lambda: self._log("Capturing in 1...", green=True))
-        self.after(3000, self._execute_spinner_capture)
+        self._after(1000, lambda: self._log("Capturing in 2...", green=True))
+        self._after(2000, lambda: self._log("Capturing in 1...", green=True))
+        self._after(3000, self._execute_spinner_capture)
     
     def _execute_spinner_capture(self):
         try:
@@ -1732,7 +1893,9 @@ class SpinHelperApp(tk.Tk):
             w = h = 60
             left, top = int(x - w//2), int(y - h//2)
             
-            baseline = ImageGrab.grab(bbox=(left, top, left + w, top + h))
+            baseline_arr = grab_array((left, top, left + w, top + h))
+            baseline = Image.fromarray(baseline_arr)
+            baseline_small = np.ascontiguousarray(_downsample(baseline_arr))
             # Auxiliary ROI just below the spinner (for games where a sub-button disappears during spin)
             try:
                 aux_h = max(10, int(h * 0.25))
@@ -1740,21 +1903,22 @@ class SpinHelperApp(tk.Tk):
                 aux_left = left + int(w * 0.2)
                 aux_right = left + int(w * 0.8)
                 aux_bbox = (aux_left, aux_y, aux_right, aux_y + aux_h)
-                aux_baseline = ImageGrab.grab(bbox=aux_bbox)
+                aux_baseline = np.ascontiguousarray(_downsample(grab_array(aux_bbox)))
             except Exception:
                 aux_baseline = None
             
-            thumb_img = baseline.copy()
-            thumb_img.thumbnail((32, 32))
-            thumbnail = ImageTk.PhotoImage(thumb_img)
+            # Preview only: nearest resample straight from the baseline (no copy, no bicubic pass)
+            thumbnail = ImageTk.PhotoImage(baseline.resize((32, 32), Image.Resampling.NEAREST))
             
-            self.state_slots.spinner.roi = SpinnerROI(left, top, w, h)
-            self.state_slots.spinner.baseline_ready = baseline
-            if aux_baseline:
+            roi = SpinnerROI(left, top, w, h)
+            self.state_slots.spinner.roi = roi
+            self.state_slots.spinner.baseline_small = baseline_small
+            if aux_baseline is not None:
                 self.state_slots.spinner.aux_roi = SpinnerROI(aux_left, aux_y, aux_right - aux_left, aux_h)
-                self.state_slots.spinner.aux_baseline_ready = aux_baseline
-            self.state_slots.spinner.ready_color = _avg_rgb(baseline)
-            self.state_slots.spinner.ready_brightness = _brightness(baseline)
+                self.state_slots.spinner.aux_baseline_small = aux_baseline
+            # Same downsampled pixels as the per-frame gate in get_current_state()
+            self.state_slots.spinner.ready_color = tuple(float(c) for c in baseline_small.reshape(-1, 3).mean(axis=0))
+            self.state_slots.spinner.ready_brightness = _luma_mean(baseline_small) / 255.0
             self.state_slots.spinner.center_xy = (x, y)
             self.state_slots.spinner.capture_time = time.time()
             self.state_slots.spinner.is_valid = True
@@ -1798,21 +1962,38 @@ class SpinHelperApp(tk.Tk):
         self.counter_mode_active = False
         self.automatic_mode_active = False
         self.slots_mode_active = False
+        self._run_gen += 1
         
         self.state_slots.automation.mode = AutomationMode.STOPPED
         self.state_slots.automation.stop_requested = True
+        self.state_slots.automation.stop_evt.set()
         
         self.click_detector.stop_monitoring()
         self.mouse_monitor.stop_monitoring()
+        # Drop queued worker updates so they cannot overwrite a reset
+        with self._ui_lock:
+            self._ui_pending.clear()
         
         self._log("All automation modes stopped", bright_blue=True)
 
-    def _position_mouse_with_grace(self, mode_name: str) -> bool:
-        """Common function to position mouse and apply grace period"""
+    def _begin_run(self) -> int:
+        """Clear stop flags for a new run and return its generation token"""
+        self.state_slots.automation.stop_requested = False
+        self.state_slots.automation.stop_evt.clear()
+        return self._run_gen
+
+    def _require_spinner(self) -> bool:
+        """UI-thread check that a spinner is captured before a mode starts"""
         if not self.state_slots.spinner.is_valid:
             messagebox.showwarning("Setup Required", "Capture spinner button first.")
             return False
-        
+        return bool(self.state_slots.spinner.center_xy)
+
+    def _position_mouse_with_grace(self, mode_name: str) -> bool:
+        """Common function to position mouse and apply grace period.
+
+        Blocks for the move plus GRACE_PERIOD_SECS, so call it from a worker thread.
+        """
         if not self.state_slots.spinner.center_xy:
             return False
             
@@ -1828,15 +2009,15 @@ class SpinHelperApp(tk.Tk):
                 try:
                     focus_x = x + random.randint(-6, 6)
                     focus_y = y - random.randint(15, 25)
-                    pg.moveTo(focus_x, focus_y, duration=0.05)
-                    pg.click()
+                    _move_click(focus_x, focus_y, duration=0.05)
                     self._log(f"{mode_name}: Focus click to bring browser to front")
                 except Exception:
                     pass
                 
                 # Grace period
                 self._log(f"{mode_name}: Grace period ({GRACE_PERIOD_SECS}s)...")
-                time.sleep(GRACE_PERIOD_SECS)
+                if self.state_slots.automation.stop_evt.wait(GRACE_PERIOD_SECS):
+                    return False
                 
                 return True
         except Exception as e:
@@ -1855,12 +2036,12 @@ class SpinHelperApp(tk.Tk):
             messagebox.showwarning("Setup Required", "Select browser window first.")
             return
         
-        if not self._position_mouse_with_grace("Slots"):
+        if not self._require_spinner():
             return
         
         self.slots_mode_active = True
         self.state_slots.automation.mode = AutomationMode.RUNNING
-        self.state_slots.automation.stop_requested = False
+        gen = self._begin_run()
         # Reset pause flags to avoid sticky paused state from previous runs
         self.state_slots.automation.paused_by_mouse = False
         self.state_slots.automation.paused_manually = False
@@ -1872,9 +2053,8 @@ class SpinHelperApp(tk.Tk):
         self.slots_ready_btn.config(state=tk.DISABLED, text="Running...")
         self.slots_pause_btn.config(state=tk.NORMAL)
         
-        # Start monitoring and automation
-        self.mouse_monitor.start_monitoring()
-        threading.Thread(target=self._slots_automation_loop, daemon=True).start()
+        # Positioning, grace period and monitoring start on the automation thread
+        threading.Thread(target=self._slots_automation_loop, args=(gen,), daemon=True).start()
         
         self._log("Slots: Ready - automation started with spin detection", green=True)
 
@@ -1901,20 +2081,23 @@ class SpinHelperApp(tk.Tk):
         
         self._log("Slots: Stop/Reset - counters cleared, calculator preserved", bright_blue=True)
 
-    def _slots_automation_loop(self):
+    def _slots_automation_loop(self, gen: int):
         """Slots automation loop with robust detection"""
         try:
-            baseline = self.state_slots.spinner.baseline_ready
+            if not self._position_mouse_with_grace("Slots") or gen != self._run_gen:
+                return
+            self.mouse_monitor.start_monitoring()
+            baseline = self.state_slots.spinner.baseline_small
             last_waggle = time.time()
             
-            while (self.slots_mode_active and 
+            while (gen == self._run_gen and self.slots_mode_active and
                    self.state_slots.automation.mode != AutomationMode.STOPPED and
                    not self.state_slots.automation.stop_requested):
                 
                 # Check pause states
                 if (self.state_slots.automation.paused_by_mouse or 
                     self.state_slots.automation.paused_manually):
-                    time.sleep(0.5)
+                    self.state_slots.automation.stop_evt.wait(0.5)
                     continue
                 
                 # Check targets
@@ -1929,11 +2112,13 @@ class SpinHelperApp(tk.Tk):
                     # If paused, loop until unpaused rather than breaking
                     if (self.state_slots.automation.paused_by_mouse or 
                         self.state_slots.automation.paused_manually):
-                        time.sleep(0.5)
+                        self.state_slots.automation.stop_evt.wait(0.5)
                         continue
                     self._log(f"Slots: Spin #{spin_num} - timeout waiting READY")
                     break
                 
+                if gen != self._run_gen:
+                    break
                 t_start = time.time()
                 self._log("Slots: Spin button looks READY — clicking", orange=True)
                 if not self.spin_detector.do_click():
@@ -1952,22 +2137,27 @@ class SpinHelperApp(tk.Tk):
                         baseline,
                         grace_sec=LONG_SPIN_GRACE_SEC,
                         max_timeout=(999999 if self.infinite_wait_var.get() else SPIN_CHANGE_TIMEOUT),
-                        allow_grace_click=True):
+                        allow_grace_click=True,
+                        started_at=t_start):
                     self._log(f"Slots: Spin #{spin_num} - completion timeout")
                     continue
                 
                 # Count successful spin and log if short — keep Actual Clicks aligned
                 elapsed_ms = (time.time() - t_start) * 1000.0
+                censored = self.spin_detector.ready_censored
+                self.spin_detector.note_spin_duration(elapsed_ms, censored)
+                # A censored duration includes the pre-wait sleep; report it as a bound
+                bound = "≤" if censored else ""
                 try:
                     self._inc_actual_clicks()
                 except Exception:
                     pass
                 self.state_slots.automation.total_done += 1
-                self.slots_counter_var.set(str(self.state_slots.automation.total_done))
+                self._ui_set(self.slots_counter_var, str(self.state_slots.automation.total_done))
                 if elapsed_ms < MIN_VALID_SPIN_MS:
-                    self._log(f"Slots: Spin #{spin_num} completed (short: {elapsed_ms:.0f} ms)", orange=True)
+                    self._log(f"Slots: Spin #{spin_num} completed (short: {bound}{elapsed_ms:.0f} ms)", orange=True)
                 else:
-                    self._log(f"Slots: Spin #{spin_num} completed successfully in {elapsed_ms:.0f} ms", green=True)
+                    self._log(f"Slots: Spin #{spin_num} completed successfully in {bound}{elapsed_ms:.0f} ms", green=True)
 
                 # Anti-idle waggle for Slots
                 if (self.waggle_on_var.get() and 
@@ -1976,15 +2166,18 @@ class SpinHelperApp(tk.Tk):
                     self._perform_waggle()
                     last_waggle = time.time()
 
-                time.sleep(random.uniform(DELAY_MIN, DELAY_MAX))
+                self.state_slots.automation.stop_evt.wait(random.uniform(DELAY_MIN, DELAY_MAX))
                     
         except Exception as e:
             self._log(f"Slots automation error: {e}", red=True)
         finally:
-            self.slots_mode_active = False
-            self.mouse_monitor.stop_monitoring()
-            self.slots_ready_btn.config(state=tk.NORMAL, text="Ready")
-            self.slots_pause_btn.config(state=tk.DISABLED)
+            release_grabber()
+            # A newer run owns the flags, monitors and buttons; leave them alone
+            if gen == self._run_gen:
+                self.slots_mode_active = False
+                self.mouse_monitor.stop_monitoring()
+                self.slots_ready_btn.config(state=tk.NORMAL, text="Ready")
+                self.slots_pause_btn.config(state=tk.DISABLED)
             self._log("Slots automation stopped", bright_blue=True)
 
     # ---------- FIXED: Counter Mode ----------
@@ -1993,10 +2186,11 @@ class SpinHelperApp(tk.Tk):
         """FIXED: Counter Ready - positions mouse and starts click detection"""
         self._stop_all_modes()
         
-        if not self._position_mouse_with_grace("Counter"):
+        if not self._require_spinner():
             return
         
         self.counter_mode_active = True
+        gen = self._begin_run()
         # Reset Actual Clicks counter for Counter mode
         self.state_slots.automation.actual_clicks = 0
         self.clicker_manual_actual_clicks.set(0)
@@ -2005,9 +2199,16 @@ class SpinHelperApp(tk.Tk):
         self.counter_ready_btn.config(state=tk.DISABLED, text="Detecting...")
         self.counter_pause_btn.config(state=tk.NORMAL)
         
-        # Start click detection
+        # Position and start click detection off the Tk thread
+        threading.Thread(target=self._counter_begin, args=(gen,), daemon=True).start()
+
+    def _counter_begin(self, gen: int):
+        """Counter worker: position mouse, then start click detection unless paused or restarted meanwhile"""
+        if not self._position_mouse_with_grace("Counter") or not self.counter_mode_active:
+            return
+        if gen != self._run_gen:
+            return
         self.click_detector.start_monitoring()
-        
         self._log("Counter: Ready - click detection started, YOU must click manually", green=True)
 
     def _counter_pause(self):
@@ -2047,12 +2248,12 @@ class SpinHelperApp(tk.Tk):
             messagebox.showwarning("Invalid Target", "Set target > 0.")
             return
         
-        if not self._position_mouse_with_grace("Automatic"):
+        if not self._require_spinner():
             return
         
         self.automatic_mode_active = True
         self.state_slots.automation.mode = AutomationMode.RUNNING
-        self.state_slots.automation.stop_requested = False
+        gen = self._begin_run()
         # Reset pause flags to ensure clean start
         self.state_slots.automation.paused_by_mouse = False
         self.state_slots.automation.paused_manually = False
@@ -2070,9 +2271,8 @@ class SpinHelperApp(tk.Tk):
         self.auto_ready_btn.config(state=tk.DISABLED, text="Running...")
         self.auto_pause_btn.config(state=tk.NORMAL)
         
-        # Start automation
-        self.mouse_monitor.start_monitoring()
-        threading.Thread(target=self._auto_automation_loop, daemon=True).start()
+        # Positioning, grace period and monitoring start on the automation thread
+        threading.Thread(target=self._auto_automation_loop, args=(gen,), daemon=True).start()
         
         self._log(f"Automatic: Ready - automation started with target {target}", green=True)
 
@@ -2100,22 +2300,25 @@ class SpinHelperApp(tk.Tk):
         
         self._log("Automatic: Stop/Reset - counters cleared, calculator preserved", bright_blue=True)
 
-    def _auto_automation_loop(self):
+    def _auto_automation_loop(self, gen: int):
         """Automatic clicker loop"""
         try:
-            baseline = self.state_slots.spinner.baseline_ready
+            if not self._position_mouse_with_grace("Automatic") or gen != self._run_gen:
+                return
+            self.mouse_monitor.start_monitoring()
+            baseline = self.state_slots.spinner.baseline_small
             # Preserve progress across resumes (unless Stop/Reset)
             done = int(self.clicker_auto_done.get() if hasattr(self, 'clicker_auto_done') else 0)
             target = self.clicker_auto_target.get()
             last_waggle = time.time()
             
-            while (self.automatic_mode_active and done < target and
+            while (gen == self._run_gen and self.automatic_mode_active and done < target and
                    not self.state_slots.automation.stop_requested):
                 
                 # Check pause states
                 if (self.state_slots.automation.paused_by_mouse or
                     self.state_slots.automation.paused_manually):
-                    time.sleep(0.5)
+                    self.state_slots.automation.stop_evt.wait(0.5)
                     continue
                 
                 next_idx = done + 1
@@ -2124,11 +2327,13 @@ class SpinHelperApp(tk.Tk):
                 if not self.spin_detector.ensure_ready_multigrace(baseline):
                     if (self.state_slots.automation.paused_by_mouse or 
                         self.state_slots.automation.paused_manually):
-                        time.sleep(0.5)
+                        self.state_slots.automation.stop_evt.wait(0.5)
                         continue
                     self._log(f"Automatic: Click #{done} - timeout waiting READY")
                     break
                 
+                if gen != self._run_gen:
+                    break
                 t_start = time.time()
                 self._log("Automatic: Spin button looks READY — clicking", orange=True)
                 if not self.spin_detector.do_click():
@@ -2146,10 +2351,15 @@ class SpinHelperApp(tk.Tk):
                         baseline,
                         grace_sec=LONG_SPIN_GRACE_SEC,
                         max_timeout=(999999 if self.infinite_wait_var.get() else SPIN_CHANGE_TIMEOUT),
-                        allow_grace_click=True):
+                        allow_grace_click=True,
+                        started_at=t_start):
                     elapsed_ms = (time.time() - t_start) * 1000.0
+                    censored = self.spin_detector.ready_censored
+                    self.spin_detector.note_spin_duration(elapsed_ms, censored)
+                    # A censored duration includes the pre-wait sleep; report it as a bound
+                    bound = "≤" if censored else ""
                     if elapsed_ms < MIN_VALID_SPIN_MS:
-                        self._log(f"Automatic: Spin #{next_idx} too short ({elapsed_ms:.0f} ms < {MIN_VALID_SPIN_MS} ms) — retrying", orange=True)
+                        self._log(f"Automatic: Spin #{next_idx} too short ({bound}{elapsed_ms:.0f} ms < {MIN_VALID_SPIN_MS} ms) — retrying", orange=True)
                         continue
                     # Count the actual click and the completed spin together to avoid mismatch
                     try:
@@ -2157,12 +2367,12 @@ class SpinHelperApp(tk.Tk):
                     except Exception:
                         pass
                     done = next_idx
-                    self.clicker_auto_done.set(done)
-                    self._log(f"Automatic: Click #{done}/{target} completed in {elapsed_ms:.0f} ms", green=True)
+                    self._ui_set(self.clicker_auto_done, done)
+                    self._log(f"Automatic: Click #{done}/{target} completed in {bound}{elapsed_ms:.0f} ms", green=True)
                     # Guardrail: stop at wager target if reached (from Clicker calculator)
                     try:
                         total_str = self.clicker_calculator.total_var.get()
-                        bet = float(self.clicker_calculator.bet_var.get() or "0")
+                        bet = self.clicker_calculator.bet
                         if total_str and total_str != "—" and bet > 0:
                             total_target = float(total_str.replace("£",""))
                             current = done * bet
@@ -2181,7 +2391,7 @@ class SpinHelperApp(tk.Tk):
                     self._perform_waggle()
                     last_waggle = time.time()
                 
-                time.sleep(random.uniform(0.3, 0.7))
+                self.state_slots.automation.stop_evt.wait(random.uniform(0.3, 0.7))
             
             if done >= target:
                 self._log(f"Automatic: Target reached - {done} spins completed", green=True)
@@ -2194,10 +2404,13 @@ class SpinHelperApp(tk.Tk):
         except Exception as e:
             self._log(f"Automatic clicker error: {e}", red=True)
         finally:
-            self.automatic_mode_active = False
-            self.mouse_monitor.stop_monitoring()
-            self.auto_ready_btn.config(state=tk.NORMAL, text="Ready")
-            self.auto_pause_btn.config(state=tk.DISABLED)
+            release_grabber()
+            # A newer run owns the flags, monitors and buttons; leave them alone
+            if gen == self._run_gen:
+                self.automatic_mode_active = False
+                self.mouse_monitor.stop_monitoring()
+                self.auto_ready_btn.config(state=tk.NORMAL, text="Ready")
+                self.auto_pause_btn.config(state=tk.DISABLED)
             self._log("Automatic clicker stopped", bright_blue=True)
 
     def _perform_waggle(self):
@@ -2231,11 +2444,10 @@ class SpinHelperApp(tk.Tk):
             
             # Check wager target
             total_str = self.slots_calculator.total_var.get()
-            bet_str = self.slots_calculator.bet_var.get()
-            if total_str != "—" and bet_str:
+            bet_per_spin = self.slots_calculator.bet
+            if total_str != "—" and bet_per_spin > 0:
                 try:
                     target_wager = float(total_str.replace("£", ""))
-                    bet_per_spin = float(bet_str)
                     current_wager = self.state_slots.automation.total_done * bet_per_spin
                     if target_wager > 0 and current_wager >= target_wager:
                         self._log(f"Slots wager target reached: £{current_wager:.2f}/£{target_wager:.2f}", green=True)
@@ -2479,7 +2691,7 @@ class SpinHelperApp(tk.Tk):
                     self.state_slots.spinner.roi = SpinnerROI(int(roi['x']), int(roi['y']), int(roi['w']), int(roi['h']))
                     self.state_slots.spinner.center_xy = tuple(sp['center_xy'])
                     self.state_slots.spinner.is_valid = False
-                    self.state_slots.spinner.baseline_ready = None
+                    self.state_slots.spinner.baseline_small = None
                     if hasattr(self, 'spinner_status_var'):
                         self.spinner_status_var.set("Spinner geometry loaded — please Capture Spinner before starting")
                 except Exception:
@@ -2572,20 +2784,60 @@ class SpinHelperApp(tk.Tk):
             color = self.tag_red
         else:
             color = None
-        self._log_q.put((msg, color))
+        self._log_q.append((msg, color))
+        self._schedule_flush()
+
+    def _ui_set(self, var, value):
+        """Set a Tk variable from any thread; applied on the next UI flush.
 
-    def _drain_log(self):
+        Only the latest value per variable is kept, so bursts cost one redraw.
+        """
+        with self._ui_lock:
+            self._ui_pending[str(var)] = (var, value)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Arm one flush UI_FLUSH_MS out if none is pending; idle UI never wakes up."""
+        with self._ui_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
         try:
-            while True:
-                msg, color = self._log_q.get_nowait()
-                ts = now_ts()
-                tags = (color,) if color else ()
-                self.log.insert(tk.END, f"{ts} {msg}\n", tags)
+            armed = self._after(UI_FLUSH_MS, self._flush_ui) is not None
+        except Exception:
+            # Window already destroyed
+            armed = False
+        if not armed:
+            # Nothing will run _flush_ui, so don't leave later updates waiting on it
+            with self._ui_lock:
+                self._flush_scheduled = False
+
+    def _flush_ui(self):
+        try:
+            # Clear the flag before draining so anything queued meanwhile re-arms a flush
+            with self._ui_lock:
+                self._flush_scheduled = False
+                pending, self._ui_pending = self._ui_pending, {}
+            for var, value in pending.values():
+                var.set(value)
+            # Single Text insert (text, tags pairs) and a single scroll per flush;
+            # consecutive lines with the same tag share one segment, order preserved
+            ts = now_ts()
+            segments = []
+            lines, last = [], None
+            while self._log_q:
+                msg, color = self._log_q.popleft()
+                if lines and color != last:
+                    segments += ["".join(lines), (last,) if last else ()]
+                    lines = []
+                lines.append(f"{ts} {msg}\n")
+                last = color
+            if lines:
+                segments += ["".join(lines), (last,) if last else ()]
+                self.log.insert(tk.END, *segments)
                 self.log.see(tk.END)
-        except queue.Empty:
+        except Exception:
             pass
-        finally:
-            self.after(UI_FLUSH_MS, self._drain_log)
 
     # ---------- Actual Clicks Counter Updater ----------
     def _inc_actual_clicks(self, x: Optional[int]=None, y: Optional[int]=None):
@@ -2594,11 +2846,11 @@ class SpinHelperApp(tk.Tk):
                 return
             self.state_slots.automation.actual_clicks += 1
             if self.slots_mode_active:
-                self.slots_actual_clicks_var.set(str(self.state_slots.automation.actual_clicks))
+                self._ui_set(self.slots_actual_clicks_var, str(self.state_slots.automation.actual_clicks))
             elif self.automatic_mode_active:
-                self.clicker_auto_actual_clicks.set(self.state_slots.automation.actual_clicks)
+                self._ui_set(self.clicker_auto_actual_clicks, self.state_slots.automation.actual_clicks)
             elif self.counter_mode_active:
-                self.clicker_manual_actual_clicks.set(self.state_slots.automation.actual_clicks)
+                self._ui_set(self.clicker_manual_actual_clicks, self.state_slots.automation.actual_clicks)
         except Exception:
             pass
 
@@ -2633,8 +2885,8 @@ class SpinHelperApp(tk.Tk):
                     return False
             else:
                 sx, sy = sp.center_xy
-                distance = math.sqrt((mx - sx)**2 + (my - sy)**2)
-                if distance > MOUSE_PAUSE_THRESHOLD:
+                dx, dy = mx - sx, my - sy
+                if dx * dx + dy * dy > MOUSE_PAUSE_THRESHOLD_SQ:
                     return False
             return True
         except Exception:
@@ -2646,7 +2898,7 @@ class SpinHelperApp(tk.Tk):
             # Uses Clicker calculator Bet/spin and Automatic Done count
             bet = 0.0
             if hasattr(self, 'clicker_calculator'):
-                bet = float(self.clicker_calculator.bet_var.get() or "0")
+                bet = self.clicker_calculator.bet
             auto_done = int(self.clicker_auto_done.get() if hasattr(self, 'clicker_auto_done') else 0)
             current = auto_done * bet
             if hasattr(self, 'clicker_auto_wager_var'):
@@ -2659,10 +2911,7 @@ class SpinHelperApp(tk.Tk):
             # Update Slots current wager based on Slots calculator bet/spin × slots spins completed
             slots_bet = 0.0
             if hasattr(self, 'slots_calculator'):
-                try:
-                    slots_bet = float(self.slots_calculator.bet_var.get() or "0")
-                except Exception:
-                    slots_bet = 0.0
+                slots_bet = self.slots_calculator.bet
             slots_spins = int(getattr(self.state_slots.automation, 'total_done', 0))
             slots_current = slots_spins * slots_bet
             if hasattr(self, 'slots_current_wager_var'):
@@ -2670,14 +2919,38 @@ class SpinHelperApp(tk.Tk):
         except Exception:
             pass
         finally:
-            self.after(1000, self._update_clicker_current_wager)
+            self._after(1000, self._update_clicker_current_wager)
+
+    def _after(self, ms, func):
+        """self.after() that tracks the callback id so destroy() can cancel it.
+
+        Once the window is closing nothing new is scheduled, so self-rescheduling
+        pollers simply stop.
+        """
+        if self._closing:
+            return None
+        def run():
+            self._after_ids.discard(after_id)
+            func()
+        after_id = self.after(ms, run)
+        self._after_ids.add(after_id)
+        return after_id
 
     def destroy(self):
+        self._closing = True
+        # Signal workers and monitors to stop; each closes its own capture handle on exit
         try:
-            if hasattr(self, 'click_detector'):
-                self.click_detector.stop_monitoring()
+            self._stop_all_modes()
         except Exception:
             pass
+        for after_id in list(self._after_ids):
+            try:
+                self.after_cancel(after_id)
+            except Exception:
+                pass
+        self._after_ids.clear()
+        # Only the Tk thread's own capture handle; workers release theirs on exit
+        release_grabber()
         self._save_geometry()
         super().destroy()
 
@@ -2688,6 +2961,8 @@ def check_dependencies():
     
     if not PIL_AVAILABLE:
         missing.append("Pillow (PIL)")
+    if not NUMPY_AVAILABLE:
+        missing.append("numpy")
     if not PYAUTOGUI_AVAILABLE:
         missing.append("pyautogui")
     